@@ -7,10 +7,18 @@ def create_app() -> Flask:
 	load_dotenv()
 	app = Flask(__name__)
 	app.config['API_KEY'] = os.getenv('API_KEY')
+	# Off unless enabled (gunicorn_config.py does), so test apps, the flask CLI and the
+	# dev server's reloader process don't poll the upstream API
+	app.config['BACKGROUND_REFRESH'] = os.getenv('BACKGROUND_REFRESH', '').strip().lower() in ('1', 'true', 'yes')
 
 	from .routes import api_bp
 	app.register_blueprint(api_bp)
 
+	# Keep the industries snapshot warm so requests never fetch it themselves
+	if app.config['BACKGROUND_REFRESH'] and not app.testing:
+		from .services.service_industries import start_background_refresh
+		start_background_refresh()
+
 	return app
 
 
@@ -1,4 +1,10 @@
-from flask import Blueprint, jsonify, request, current_app
+import hmac
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import orjson
+from flask import Blueprint, Response, g, request, current_app
 
 from .services.service_industries import (
 	get_industries,
@@ -13,12 +19,57 @@ from .services.service_industries import (
 	search_companies,
 	get_available_periods,
 	get_discover_schema,
+	get_default_industry_rankings_json,
+	get_default_industry_companies_json,
 	load_data,
 )
 
 
 api_bp = Blueprint('api', __name__)
 
+# GET endpoints whose output only depends on the data snapshot and an optional industry.
+# Default rankings/companies bodies are already prebuilt per snapshot by the service layer.
+_CACHEABLE_ENDPOINTS = frozenset({
+	'api.api_get_industries',
+	'api.api_get_industry_overview',
+	'api.api_get_top_companies',
+	'api.api_get_periods',
+	'api.api_discover',
+})
+# The cacheable endpoints whose body depends on an industry (path or query argument)
+_INDUSTRY_CACHEABLE_ENDPOINTS = frozenset({
+	'api.api_get_industry_overview',
+	'api.api_get_top_companies',
+	'api.api_get_periods',
+})
+_RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# (snapshot digest, endpoint, normalized industry) -> rendered JSON body, least recently used first
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, str, Optional[str]], bytes]" = OrderedDict()
+_RESPONSE_CACHE_BYTES = 0
+_RESPONSE_CACHE_LOCK = threading.Lock()
+# Endpoints that clients may cache themselves; the data changes at most once per snapshot
+# TTL (600s). `private` because responses sit behind the bearer token and must not be
+# served to other callers by shared caches.
+_CLIENT_CACHEABLE_ENDPOINTS = frozenset({
+	'api.api_get_industries',
+	'api.api_get_periods',
+	'api.api_discover',
+})
+_CLIENT_CACHE_CONTROL = 'private, max-age=600, stale-while-revalidate=600'
+# Bump whenever response bodies change shape for the same upstream data, so clients
+# holding old-format bodies stop getting 304s after a deploy
+_RESPONSE_FORMAT_VERSION = '2'
+
+
+def _norm_industry(industry: str) -> str:
+	"""Normalize an industry argument to the upper-cased key the service layer expects."""
+	return industry.strip().upper()
+
+
+def _json_response(payload, status: int = 200) -> Response:
+	"""Serialize `payload` with orjson into a JSON response (faster than `jsonify`)."""
+	return current_app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
 
 @api_bp.before_request
 def _enforce_bearer_token():
@@ -27,14 +78,98 @@ def _enforce_bearer_token():
 		return None
 	expected_key = current_app.config.get('API_KEY')
 	if not expected_key:
-		return jsonify({"error": "Unauthorized"}), 401
-	auth_header = request.headers.get('Authorization', '')
+		return _json_response({"error": "Unauthorized"}, 401)
+	# Read the raw WSGI header; PEP 3333 strings are latin-1, so encoding recovers the sent bytes
+	auth_header = request.environ.get('HTTP_AUTHORIZATION', '')
 	prefix = 'Bearer '
 	if not auth_header.startswith(prefix):
-		return jsonify({"error": "Unauthorized"}), 401
-	provided_key = auth_header[len(prefix):]
-	if provided_key != expected_key:
-		return jsonify({"error": "Forbidden"}), 403
+		return _json_response({"error": "Unauthorized"}, 401)
+	provided_key = auth_header[len(prefix):].encode('latin-1')
+	# Constant-time comparison so response timing does not leak the key
+	if not hmac.compare_digest(provided_key, expected_key.encode()):
+		return _json_response({"error": "Forbidden"}, 403)
+
+
+def _etag(digest: str) -> str:
+	"""Return the ETag value for a snapshot digest, scoped to the current response format."""
+	return f"{_RESPONSE_FORMAT_VERSION}-{digest}"
+
+
+def _response_cache_key(snap) -> Optional[Tuple[str, str, Optional[str]]]:
+	"""Key a cacheable request on the snapshot, the endpoint and the industry its view reads.
+
+	Returns None for industries missing from the snapshot, so arbitrary names never get stored.
+	"""
+	industry = None
+	if request.endpoint in _INDUSTRY_CACHEABLE_ENDPOINTS:
+		industry = (request.view_args or {}).get('industry') or request.args.get('industry') or None
+		if industry is not None:
+			industry = _norm_industry(industry)
+			if industry not in snap.overview_by_name and industry not in snap.periods_by_industry:
+				return None
+	return (snap.digest, request.endpoint, industry)
+
+
+@api_bp.before_request
+def _serve_cached_response():
+	# Registered after the bearer check, so only authorized requests get here
+	if request.endpoint not in _CACHEABLE_ENDPOINTS:
+		return None
+	# The views render from this same snapshot, so bodies always match the digest they are stored under
+	snap = g.snap = load_data()
+	if request.method != 'GET':
+		return None
+	etag = _etag(snap.digest)
+	if request.if_none_match.contains_weak(etag):
+		response = Response(status=304)
+		response.set_etag(etag, weak=True)
+		return response
+	key = _response_cache_key(snap)
+	if key is None:
+		return None
+	with _RESPONSE_CACHE_LOCK:
+		body = _RESPONSE_CACHE.get(key)
+		if body is not None:
+			_RESPONSE_CACHE.move_to_end(key)
+	if body is None:
+		# Let the view render it; `_store_cached_response` keeps the body
+		g.response_cache_key = key
+		return None
+	response = current_app.response_class(body, status=200, mimetype='application/json')
+	response.set_etag(etag, weak=True)
+	return response
+
+
+@api_bp.after_request
+def _store_cached_response(response):
+	global _RESPONSE_CACHE_BYTES
+	key = g.get('response_cache_key')
+	if key is None or response.status_code != 200:
+		return response
+	body = response.get_data()
+	if len(body) <= _RESPONSE_CACHE_MAX_BYTES:
+		with _RESPONSE_CACHE_LOCK:
+			previous = _RESPONSE_CACHE.pop(key, None)
+			if previous is not None:
+				_RESPONSE_CACHE_BYTES -= len(previous)
+			_RESPONSE_CACHE[key] = body
+			_RESPONSE_CACHE_BYTES += len(body)
+			# Evict least recently used bodies (old snapshots' included) until under the byte cap
+			while _RESPONSE_CACHE_BYTES > _RESPONSE_CACHE_MAX_BYTES:
+				_old_key, evicted = _RESPONSE_CACHE.popitem(last=False)
+				_RESPONSE_CACHE_BYTES -= len(evicted)
+	response.set_etag(_etag(key[0]), weak=True)
+	return response
+
+
+@api_bp.after_request
+def _set_client_cache_headers(response):
+	# Also applies to 304s, which must repeat the caching headers of the full response
+	if g.get('snap') is None or request.endpoint not in _CLIENT_CACHEABLE_ENDPOINTS:
+		return response
+	if response.status_code in (200, 304):
+		response.headers['Cache-Control'] = _CLIENT_CACHE_CONTROL
+	return response
 
 
 @api_bp.get('/')
@@ -52,18 +187,21 @@ def health_check():
 
 @api_bp.get('/industries')
 def api_get_industries():
-	# Ensure data is loaded/normalized
-	load_data()
-	return jsonify({"industries": get_industries()}), 200
+	return _json_response({"industries": get_industries(snap=g.snap)})
 
 
 @api_bp.get('/industry/<string:industry>/companies')
 def api_get_industry_companies(industry: str):
 	load_data()
+	industry = _norm_industry(industry)
 	year = request.args.get('year', default=None, type=str)
 	month = request.args.get('month', default=None, type=int)
+	if year is None and month is None:
+		body = get_default_industry_companies_json(industry)
+		if body is not None:
+			return current_app.response_class(body, status=200, mimetype='application/json')
 	companies = get_industry_companies(industry, year=year, month=month)
-	return jsonify({"industry": industry.upper(), "year": year, "month": month, "companies": companies}), 200
+	return _json_response({"industry": industry, "year": year, "month": month, "companies": companies})
 
 
 @api_bp.get('/company')
@@ -73,12 +211,12 @@ def api_get_company():
 	year = request.args.get('year', default=None, type=str)
 	month = request.args.get('month', default=None, type=int)
 	if not name:
-		return jsonify({"error": "Query parameter 'name' is required"}), 400
+		return _json_response({"error": "Query parameter 'name' is required"}, 400)
 	# Return the single matching entry (defaults to latest period when not provided)
 	data = get_company_data(name, year=year, month=month)
 	if not data:
-		return jsonify({"error": f"Company not found: {name}"}), 404
-	return jsonify(data), 200
+		return _json_response({"error": f"Company not found: {name}"}, 404)
+	return _json_response(data)
 
 
 @api_bp.post('/companies')
@@ -91,66 +229,78 @@ def api_get_companies():
 	year = body.get('year')
 	month = body.get('month')
 	if not isinstance(companies, list) or not all(isinstance(x, str) for x in companies):
-		return jsonify({"error": "Request JSON must include 'companies': [string, ...]"}), 400
+		return _json_response({"error": "Request JSON must include 'companies': [string, ...]"}, 400)
 	if month is not None:
 		try:
 			month = int(month)
 		except (TypeError, ValueError):
-			return jsonify({"error": "'month' must be an integer if provided"}), 400
+			return _json_response({"error": "'month' must be an integer if provided"}, 400)
+	if industry:
+		industry = _norm_industry(industry)
+		if not industry:
+			return _json_response({"error": "'industry' must not be blank if provided"}, 400)
+	else:
+		industry = None
 	results = get_companies_data(companies, industry=industry, year=year, month=month)
-	return jsonify({"industry": (industry.upper() if industry else None), "year": year, "month": month, "results": results}), 200
+	return _json_response({"industry": industry, "year": year, "month": month, "results": results})
 
 
 @api_bp.get('/industry/<string:industry>/rank/<int:rank>')
 def api_get_company_nth_rank(industry: str, rank: int):
 	load_data()
+	industry = _norm_industry(industry)
 	year = request.args.get('year', default=None, type=str)
 	month = request.args.get('month', default=None, type=int)
 	data = get_company_nth_rank(rank, industry, year=year, month=month)
 	if not data:
-		return jsonify({"error": "Not found"}), 404
-	return jsonify(data), 200
+		return _json_response({"error": "Not found"}, 404)
+	return _json_response(data)
 
 
 @api_bp.get('/industry/<string:industry>/rankings')
 def api_get_industry_rankings(industry: str):
 	load_data()
+	industry = _norm_industry(industry)
 	year = request.args.get('year', default=None, type=str)
 	month = request.args.get('month', default=None, type=int)
 	try:
 		limit = request.args.get('limit', default=None, type=int)
 		if limit is not None and limit < 0:
-			return jsonify({"error": "'limit' must be >= 0"}), 400
+			return _json_response({"error": "'limit' must be >= 0"}, 400)
 		offset = request.args.get('offset', default=0, type=int)
 		if offset < 0:
-			return jsonify({"error": "'offset' must be >= 0"}), 400
+			return _json_response({"error": "'offset' must be >= 0"}, 400)
 	except (TypeError, ValueError):
-		return jsonify({"error": "Invalid 'limit' or 'offset'"}), 400
+		return _json_response({"error": "Invalid 'limit' or 'offset'"}, 400)
+	if year is None and month is None and limit is None and offset == 0:
+		body = get_default_industry_rankings_json(industry)
+		if body is not None:
+			return current_app.response_class(body, status=200, mimetype='application/json')
 	items = get_industry_rankings(industry, limit=limit, offset=offset, year=year, month=month)
-	return jsonify({
-		"industry": industry.upper(),
+	return _json_response({
+		"industry": industry,
 		"year": year,
 		"month": month,
 		"limit": limit,
 		"offset": offset,
 		"results": items,
-	}), 200
+	})
 
 
 @api_bp.get('/industry/<string:industry>/overview')
 def api_get_industry_overview(industry: str):
-	load_data()
-	overview = get_industry_overview(industry)
+	industry = _norm_industry(industry)
+	overview = get_industry_overview(industry, snap=g.snap)
 	if not overview:
-		return jsonify({"error": "Industry not found"}), 404
-	return jsonify(overview), 200
+		return _json_response({"error": "Industry not found"}, 404)
+	return _json_response(overview)
 
 
 @api_bp.get('/industry/<string:industry>/top-companies')
 def api_get_top_companies(industry: str):
-	load_data()
-	items = get_top_companies(industry)
-	return jsonify({"industry": industry.upper(), "top_companies": items}), 200
+	industry = _norm_industry(industry)
+	items = get_top_companies(industry, snap=g.snap)
+	return _json_response({"industry": industry, "top_companies": items})
 
 
 @api_bp.get('/search/companies')
@@ -161,26 +311,30 @@ def api_search_companies():
 	year = request.args.get('year', default=None, type=str)
 	month = request.args.get('month', default=None, type=int)
 	if not company:
-		return jsonify({"error": "Query parameter 'company' is required"}), 400
+		return _json_response({"error": "Query parameter 'company' is required"}, 400)
 	if limit <= 0:
-		return jsonify({"error": "'limit' must be > 0"}), 400
+		return _json_response({"error": "'limit' must be > 0"}, 400)
 	results = search_companies(company, limit=limit, year=year, month=month)
-	return jsonify({"company": company, "year": year, "month": month, "limit": limit, "results": results}), 200
+	return _json_response({"company": company, "year": year, "month": month, "limit": limit, "results": results})
 
 
 @api_bp.get('/periods')
 def api_get_periods():
-	load_data()
 	industry = request.args.get('industry', default=None, type=str)
-	items = get_available_periods(industry=industry)
-	return jsonify({"industry": (industry.upper() if industry else None), "periods": items}), 200
+	if industry:
+		industry = _norm_industry(industry)
+		if not industry:
+			return _json_response({"error": "Query parameter 'industry' must not be blank"}, 400)
+	else:
+		industry = None
+	items = get_available_periods(industry=industry, snap=g.snap)
+	return _json_response({"industry": industry, "periods": items})
 
 
 @api_bp.get('/discover')
 def api_discover():
-	load_data()
-	data = get_discover_schema()
-	return jsonify(data), 200
+	data = get_discover_schema(snap=g.snap)
+	return _json_response(data)
 
 
 
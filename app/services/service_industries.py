@@ -1,18 +1,38 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
+import logging
+import threading
 import time
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 EXTERNAL_INDUSTRIES_URL = "https://index-webapp-app-l4agj.ondigitalocean.app/api/v1/index/industries"
 
 
-_CACHE: Optional[Dict] = None
-_CACHE_TS: Optional[float] = None
+logger = logging.getLogger(__name__)
+
+_CACHE: Optional["IndexSnapshot"] = None
 _CACHE_TTL_SECONDS: int = 600
+# Proactive refresh period, so the snapshot is replaced before it ever goes stale
+_REFRESH_INTERVAL_SECONDS: int = _CACHE_TTL_SECONDS - 60
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_THREAD: Optional[threading.Thread] = None
+_NAME_SEPARATOR = "\x00"
+# Sort position for entries without a usable ranking (after every ranked entry)
+_UNRANKED = 10**9
+
+# Shared session so cache refreshes reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2)))
 
 
 def _rename_metric_fields(entry: Dict) -> None:
@@ -50,106 +70,315 @@ def _normalize_scores_data(data: Dict) -> None:
 				_rename_metric_fields(entry)
 
 
-def _load_data() -> Dict:
-	"""Fetch and cache industries data from the remote endpoint with TTL caching.
+@dataclass(slots=True)
+class IndexSnapshot:
+	"""Cached dataset plus lookup indices derived from it once per refresh."""
+	raw: Dict
+	loaded_at: float = field(default_factory=time.time)
+	# Content hash of the upstream payload; identifies the snapshot across workers
+	digest: str = ""
+	# Top-level payload sections, bound once so lookups skip the dict-get chains
+	scores_data: Dict[str, List[Dict]] = field(default_factory=dict)
+	industry_names: Tuple[str, ...] = ()
+	# upper-cased industry name -> overview object from data[]
+	overview_by_name: Dict[str, Dict] = field(default_factory=dict)
+	# Parallel per-entry arrays in dataset scan order, with all coercions done at build time.
+	# `rows` are API-shaped copies of each normalized entry tagged with its industry key;
+	# `rankings` holds int sort keys with _UNRANKED for missing/malformed values
+	rows: List[Dict] = field(default_factory=list)
+	names_lc: List[str] = field(default_factory=list)
+	industries: List[str] = field(default_factory=list)
+	rankings: List[int] = field(default_factory=list)
+	years: List[Optional[str]] = field(default_factory=list)
+	months: List[Optional[int]] = field(default_factory=list)
+	# stripped, lowercased company name -> row indices into the arrays above
+	by_company_lc: Dict[str, List[int]] = field(default_factory=dict)
+	# names_lc joined with NUL separators, plus the start offset of each name in it
+	names_haystack: str = ""
+	name_offsets: List[int] = field(default_factory=list)
+	# (industry key, year, month) partial-period query -> ranked rows, filled lazily
+	rankings_memo: Dict[Tuple[str, Optional[str], Optional[int]], List[Dict]] = field(default_factory=dict)
+	# Payload served by get_discover_schema()
+	discover_schema: Dict = field(default_factory=dict)
+	# industry key -> encoded response body for the default (latest period, unpaginated) query, filled lazily
+	default_rankings_json: Dict[str, bytes] = field(default_factory=dict)
+	default_companies_json: Dict[str, bytes] = field(default_factory=dict)
+	# industry key -> all rows sorted by ranking asc
+	sorted_by_industry: Dict[str, List[Dict]] = field(default_factory=dict)
+	# (industry key, year str, month int) -> rows sorted by ranking asc
+	by_industry_period: Dict[Tuple[str, str, int], List[Dict]] = field(default_factory=dict)
+	# industry key -> ({ year: str, month: int }, ...) in chronological order; all_periods spans every industry
+	periods_by_industry: Dict[str, Tuple[Dict, ...]] = field(default_factory=dict)
+	all_periods: Tuple[Dict, ...] = ()
+	latest_period_by_industry: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+	latest_period_by_company: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+
+
+def _parse_ranking(value: object) -> Optional[int]:
+	"""Coerce a raw ranking value to int, or None if it is missing or malformed."""
+	try:
+		return int(value)  # type: ignore[arg-type]
+	except (TypeError, ValueError):
+		return None
 
-	Attempts GET first; if it fails, falls back to POST with an empty JSON body.
-	"""
-	global _CACHE, _CACHE_TS
-	now = time.time()
-	if _CACHE is not None and _CACHE_TS is not None and (now - _CACHE_TS) < _CACHE_TTL_SECONDS:
-		return _CACHE  # type: ignore[return-value]
-
-	def _fetch_remote() -> Dict:
-		resp = requests.post(EXTERNAL_INDUSTRIES_URL, timeout=15)
-		if resp.ok:
-			resp.raise_for_status()
-			return resp.json()
-
-	data = _fetch_remote()
+
+def _period_payload(pairs: Set[Tuple[int, int]]) -> Tuple[Dict, ...]:
+	"""Sort numeric (year, month) pairs chronologically into a tuple of { year: str, month } items."""
+	return tuple({"year": str(y), "month": m} for (y, m) in sorted(pairs))
+
+
+def _rebuild_indices(raw: Dict) -> IndexSnapshot:
+	"""Build the lookup indices used by the query functions from normalized raw data."""
+	snap = IndexSnapshot(
+		raw=raw,
+		scores_data=raw.get("scoresData", {}) or {},
+		industry_names=tuple(raw.get("industries") or ()),
+	)
+	for item in raw.get("data") or ():
+		# First overview wins, as with the previous linear search
+		snap.overview_by_name.setdefault(str(item.get("name", "")).upper(), item)
+	all_pairs: Set[Tuple[int, int]] = set()
+	# Latest numeric (year, month) per industry and per company, tracked in the same pass
+	latest_by_industry: Dict[str, Tuple[int, int]] = {}
+	latest_by_company: Dict[str, Tuple[int, int]] = {}
+	for industry_key, entries in snap.scores_data.items():
+		if not isinstance(entries, list):
+			continue
+		pairs: Set[Tuple[int, int]] = set()
+		first = len(snap.rows)
+		for entry in entries:
+			company = str(entry.get("company", ""))
+			name = company.strip().lower()
+			year_val = entry.get("year")
+			try:
+				month_int: Optional[int] = int(entry.get("month"))
+			except (TypeError, ValueError):
+				month_int = None
+			ranking = _parse_ranking(entry.get("ranking"))
+			row = dict(entry, industry=industry_key)
+			# Serve numeric-string rankings as real ints
+			if ranking is not None and isinstance(row.get("ranking"), str):
+				row["ranking"] = ranking
+			snap.by_company_lc.setdefault(name, []).append(len(snap.rows))
+			snap.rows.append(row)
+			snap.names_lc.append(company.lower())
+			snap.industries.append(industry_key)
+			snap.rankings.append(_UNRANKED if ranking is None else ranking)
+			snap.years.append(None if year_val is None else str(year_val))
+			snap.months.append(month_int)
+			if year_val is None or month_int is None:
+				continue
+			# Periods are only listed for numeric years
+			try:
+				y = int(str(year_val))
+			except ValueError:
+				continue
+			period = (y, month_int)
+			pairs.add(period)
+			if period > latest_by_industry.get(industry_key, (0, 0)):
+				latest_by_industry[industry_key] = period
+			if period > latest_by_company.get(name, (0, 0)):
+				latest_by_company[name] = period
+		# Sort row indices once by the pre-coerced rankings; period buckets inherit the order
+		order = sorted(range(first, len(snap.rows)), key=snap.rankings.__getitem__)
+		snap.sorted_by_industry[industry_key] = [snap.rows[i] for i in order]
+		for i in order:
+			if snap.years[i] is not None and snap.months[i] is not None:
+				snap.by_industry_period.setdefault((industry_key, snap.years[i], snap.months[i]), []).append(snap.rows[i])
+		all_pairs.update(pairs)
+		snap.periods_by_industry[industry_key] = _period_payload(pairs)
+	snap.all_periods = _period_payload(all_pairs)
+	# Stored with string years to match the year filters used by the query functions
+	snap.latest_period_by_industry = {k: (str(y), m) for k, (y, m) in latest_by_industry.items()}
+	snap.latest_period_by_company = {k: (str(y), m) for k, (y, m) in latest_by_company.items()}
+	offset = 0
+	for name in snap.names_lc:
+		snap.name_offsets.append(offset)
+		offset += len(name) + 1
+	snap.names_haystack = _NAME_SEPARATOR.join(snap.names_lc)
+	snap.discover_schema = _build_discover_schema(snap)
+	return snap
+
+
+def _fetch_remote() -> bytes:
+	"""Fetch the raw industries payload body, raising on HTTP errors."""
+	resp = _SESSION.post(EXTERNAL_INDUSTRIES_URL, timeout=15)
+	resp.raise_for_status()
+	return resp.content
+
+
+def _refresh() -> IndexSnapshot:
+	"""Fetch, normalize and index fresh data, then publish it as the cached snapshot."""
+	global _CACHE
+	body = _fetch_remote()
+	# orjson decodes the multi-megabyte payload in C, straight from bytes
+	try:
+		data = orjson.loads(body)
+	except orjson.JSONDecodeError:
+		# orjson rejects NaN/Infinity literals, which the stdlib parser accepts
+		data = json.loads(body)
 	# Normalize metric field names immediately after loading
 	_normalize_scores_data(data)
-	_CACHE = data
-	_CACHE_TS = now
-	return data
+	snap = _rebuild_indices(data)
+	snap.digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+	# Single reference swap so readers never see a half-built snapshot
+	_CACHE = snap
+	return snap
+
+
+def _background_refresh() -> None:
+	"""Refresh the snapshot off the request path; the caller holds `_REFRESH_LOCK`."""
+	try:
+		_refresh()
+	except Exception:
+		# Keep serving the stale snapshot; the next stale read retries
+		logger.exception("Background refresh of industries data failed")
+	finally:
+		_REFRESH_LOCK.release()
+
+
+def _refresh_loop() -> None:
+	"""Refresh the snapshot forever, every `_REFRESH_INTERVAL_SECONDS`, starting immediately."""
+	while True:
+		try:
+			with _REFRESH_LOCK:
+				_refresh()
+		except Exception:
+			# Keep serving the existing snapshot; the next tick retries
+			logger.exception("Scheduled refresh of industries data failed")
+		time.sleep(_REFRESH_INTERVAL_SECONDS)
+
 
+def start_background_refresh() -> None:
+	"""Start the daemon thread that keeps the snapshot fresh, once per process.
 
-def load_data() -> Dict:
+	With it running, requests are served from memory and never wait on the remote
+	endpoint, except for requests that arrive before the first load has finished.
+	"""
+	global _REFRESH_THREAD
+	if _REFRESH_THREAD is not None:
+		return
+	_REFRESH_THREAD = threading.Thread(target=_refresh_loop, name="industries-refresh", daemon=True)
+	_REFRESH_THREAD.start()
+
+
+def _load_data() -> IndexSnapshot:
+	"""Return the cached snapshot, refreshing it from the remote endpoint after the TTL.
+
+	Only one thread fetches at a time. Once a snapshot exists, expired reads return it
+	immediately while a background thread refreshes (stale-while-revalidate); only the
+	very first load blocks.
+	"""
+	snap = _CACHE
+	if snap is not None:
+		if (time.time() - snap.loaded_at) >= _CACHE_TTL_SECONDS and _REFRESH_LOCK.acquire(blocking=False):
+			threading.Thread(target=_background_refresh, daemon=True).start()
+		return snap
+	with _REFRESH_LOCK:
+		# Another thread may have completed the initial load while we waited
+		if _CACHE is not None:
+			return _CACHE
+		return _refresh()
+
+
+def load_data() -> IndexSnapshot:
 	"""Public accessor to fetch (and cache) the current dataset, ensuring normalization."""
 	return _load_data()
 
 
-def get_industries() -> List[str]:
+# The query functions below take industries as upper-cased keys (routes normalize them once
+# at the boundary). Company names are accepted as given and normalized here. Functions with
+# a `snap` argument read that snapshot instead of the current one when it is given.
+
+
+def get_industries(snap: Optional[IndexSnapshot] = None) -> List[str]:
 	"""Return the list of industries (e.g., ["CPG", "BANKING"])."""
-	data = _load_data()
-	industries = data.get("industries") or []
-	return list(industries)
+	return list((snap or _load_data()).industry_names)
 
 
-def get_industry_overview(industry: str) -> Optional[Dict]:
+def get_industry_overview(industry: str, snap: Optional[IndexSnapshot] = None) -> Optional[Dict]:
 	"""Return overview object for an industry from data[]."""
-	data = _load_data()
-	for item in data.get("data", []):
-		if str(item.get("name", "")).upper() == industry.upper():
-			return item
-	return None
+	return (snap or _load_data()).overview_by_name.get(industry)
 
 
-def _get_scores_for_industry(industry: str) -> List[Dict]:
-	data = _load_data()
-	scores = data.get("scoresData", {})
-	return list(scores.get(industry.upper(), []))
+def _get_ranked_entries(snap: IndexSnapshot, industry_key: str, year: Optional[str], month: Optional[int]) -> List[Dict]:
+	"""Return an industry's rows for a period, sorted by ranking asc.
 
+	Defaults to the latest period when neither year nor month is given. Full periods
+	come straight from the prebuilt buckets; partial filters are memoized per snapshot.
+	"""
+	if year is None and month is None:
+		latest = snap.latest_period_by_industry.get(industry_key)
+		if latest is None:
+			return snap.sorted_by_industry.get(industry_key, [])
+		year, month = latest
+	if year is not None and month is not None:
+		try:
+			return snap.by_industry_period.get((industry_key, str(year), int(month)), [])
+		except (TypeError, ValueError):
+			return []
+	memo_key = (industry_key, None if year is None else str(year), month)
+	rows = snap.rankings_memo.get(memo_key)
+	if rows is None:
+		rows = _filter_entries(snap.sorted_by_industry.get(industry_key, []), year=year, month=month)
+		# Only non-empty views are kept so unknown query values cannot grow the memo
+		if rows:
+			snap.rankings_memo[memo_key] = rows
+	return rows
 
-def _get_latest_period_for_industry(industry: str) -> Optional[Dict[str, object]]:
-	"""Return latest { year: str, month: int } for the given industry, or None."""
-	periods = get_available_periods(industry=industry)
-	if not periods:
-		return None
-	return periods[-1]
 
+def get_industry_companies(industry: str, year: Optional[str] = None, month: Optional[int] = None) -> List[str]:
+	"""Return ranked company names for an industry, ordered by ranking asc.
 
-def _get_latest_period_for_company(company: str) -> Optional[Dict[str, object]]:
-	"""Return latest { year: str, month: int } where the company appears, or None."""
-	needle = company.strip().lower()
-	data = _load_data()
-	latest_year: Optional[int] = None
-	latest_month: Optional[int] = None
-	for _industry_key, entries in (data.get("scoresData", {}) or {}).items():
-		for entry in entries:
-			name = str(entry.get("company", "")).strip().lower()
-			if name != needle:
-				continue
-			try:
-				y = int(str(entry.get("year")))
-				m = int(str(entry.get("month")))
-			except (TypeError, ValueError):
-				continue
-			if latest_year is None or (y, m) > (latest_year, latest_month or 0):
-				latest_year, latest_month = y, m
-	if latest_year is None or latest_month is None:
-		return None
-	return {"year": str(latest_year), "month": int(latest_month)}
+	Defaults to the latest period when no filters are provided.
+	"""
+	return _company_names(_get_ranked_entries(_load_data(), industry, year=year, month=month))
 
 
-def get_industry_companies(industry: str, year: Optional[str] = None, month: Optional[int] = None) -> List[str]:
-	"""Return ranked company names for an industry, ordered by ranking asc.
+def _company_names(entries: List[Dict]) -> List[str]:
+	return [str(entry.get("company", "")).strip() for entry in entries if entry.get("company")]
 
-	Falls back to top_companies names if detailed scores are missing.
+
+def _default_body_json(memo: Dict[str, bytes], snap: IndexSnapshot, industry: str, build) -> Optional[bytes]:
+	"""Return the memoized default-query body for an industry, encoding `build(rows)` on first use.
+
+	Returns None for unknown industries and for rows orjson cannot encode, so the route
+	falls back to rendering the response itself.
 	"""
-	# Default to latest period if no filters provided
-	if year is None and month is None:
-		latest = _get_latest_period_for_industry(industry)
-		if latest:
-			year, month = str(latest["year"]), int(latest["month"])  # type: ignore[index]
-	scores = _get_scores_for_industry(industry)
-	if not scores:
-		return []
-	filtered = _filter_entries(scores, year=year, month=month)
-	if not filtered:
-		return []
-	sorted_scores = sorted(filtered, key=lambda r: int(r.get("ranking", 10**9)))
-	return [str(entry.get("company", "")).strip() for entry in sorted_scores if entry.get("company")]
+	body = memo.get(industry)
+	if body is None and industry in snap.sorted_by_industry:
+		rows = _get_ranked_entries(snap, industry, year=None, month=None)
+		try:
+			body = memo[industry] = orjson.dumps(build(rows))
+		except orjson.JSONEncodeError:
+			logger.warning("Cannot prebuild default response body for industry %s", industry)
+			return None
+	return body
+
+
+def get_default_industry_rankings_json(industry: str) -> Optional[bytes]:
+	"""Return the /industry/<industry>/rankings body for the default query, if any."""
+	snap = _load_data()
+	# Same shape and key order as the route handler's payload
+	return _default_body_json(snap.default_rankings_json, snap, industry, lambda rows: {
+		"industry": industry,
+		"year": None,
+		"month": None,
+		"limit": None,
+		"offset": 0,
+		"results": rows,
+	})
+
+
+def get_default_industry_companies_json(industry: str) -> Optional[bytes]:
+	"""Return the /industry/<industry>/companies body for the default query, if any."""
+	snap = _load_data()
+	return _default_body_json(snap.default_companies_json, snap, industry, lambda rows: {
+		"industry": industry,
+		"year": None,
+		"month": None,
+		"companies": _company_names(rows),
+	})
 
 
 def get_company_data(company: str, year: Optional[str] = None, month: Optional[int] = None) -> Optional[Dict]:
@@ -157,20 +386,19 @@ def get_company_data(company: str, year: Optional[str] = None, month: Optional[i
 
 	Adds an "industry" field to the returned dict.
 	"""
-	# If no period specified, pick the latest available period for this company
+	return _find_company_row(_load_data(), company.strip().lower(), year=year, month=month)
+
+
+def _find_company_row(snap: IndexSnapshot, needle: str, year: Optional[str], month: Optional[int]) -> Optional[Dict]:
+	"""Return the first row for a lowercased company name, defaulting to its latest period."""
 	if year is None and month is None:
-		latest = _get_latest_period_for_company(company)
+		latest = snap.latest_period_by_company.get(needle)
 		if latest:
-			year, month = str(latest["year"]), int(latest["month"])  # type: ignore[index]
-	needle = company.strip().lower()
-	data = _load_data()
-	for industry_key, entries in (data.get("scoresData", {}) or {}).items():
-		for entry in entries:
-			name = str(entry.get("company", "")).strip().lower()
-			if name == needle and _matches_year_month(entry, year=year, month=month):
-				result = _transform_entry(entry)
-				result["industry"] = industry_key
-				return result
+			year, month = latest
+	for i in snap.by_company_lc.get(needle, ()):
+		row = snap.rows[i]
+		if _matches_year_month(row, year=year, month=month):
+			return row
 	return None
 
 
@@ -181,49 +409,46 @@ def get_company_entries(company: str, year: Optional[str] = None, month: Optiona
 	Optionally filters by year and/or month.
 	"""
 	needle = company.strip().lower()
-	data = _load_data()
+	snap = _load_data()
 	results: List[Dict] = []
-	for industry_key, entries in (data.get("scoresData", {}) or {}).items():
-		for entry in entries:
-			name = str(entry.get("company", "")).strip().lower()
-			if name == needle and _matches_year_month(entry, year=year, month=month):
-				result = _transform_entry(entry)
-				result["industry"] = industry_key
-				results.append(result)
+	for i in snap.by_company_lc.get(needle, ()):
+		row = snap.rows[i]
+		if _matches_year_month(row, year=year, month=month):
+			results.append(row)
 	return results
 
 
 def get_companies_data(company_list: List[str], industry: Optional[str] = None, year: Optional[str] = None, month: Optional[int] = None) -> Dict[str, Optional[Dict]]:
 	"""Return a mapping of company name to company data.
 
-	If industry is provided, the search is restricted to that industry.
+	If industry is provided, the search is restricted to that industry. Results are
+	keyed by the names as given; each is normalized here for the lookup.
 	"""
 	results: Dict[str, Optional[Dict]] = {}
 	if not company_list:
 		return results
+	snap = _load_data()
+	keys = [name.strip().lower() for name in company_list]
 
 	if industry:
 		# Default to latest industry period when not provided
 		if year is None and month is None:
-			latest = _get_latest_period_for_industry(industry)
+			latest = snap.latest_period_by_industry.get(industry)
 			if latest:
-				year, month = str(latest["year"]), int(latest["month"])  # type: ignore[index]
-		entries = _filter_entries(_get_scores_for_industry(industry), year=year, month=month)
-		index = {str(e.get("company", "")).strip().lower(): e for e in entries}
-		for name in company_list:
-			key = name.strip().lower()
-			entry = index.get(key)
-			if entry:
-				val = _transform_entry(entry)
-				val["industry"] = industry.upper()
-				results[name] = val
-			else:
-				results[name] = None
+				year, month = latest
+		for name, key in zip(company_list, keys):
+			results[name] = None
+			# The last matching entry in dataset order wins within an industry
+			for i in reversed(snap.by_company_lc.get(key, ())):
+				row = snap.rows[i]
+				if snap.industries[i] == industry and _matches_year_month(row, year=year, month=month):
+					results[name] = row
+					break
 		return results
 
 	# Global search
-	for name in company_list:
-		results[name] = get_company_data(name, year=year, month=month)
+	for name, key in zip(company_list, keys):
+		results[name] = _find_company_row(snap, key, year=year, month=month)
 	return results
 
 
@@ -231,20 +456,10 @@ def get_company_nth_rank(rank: int, industry: str, year: Optional[str] = None, m
 	"""Return the company ranking entry at position `rank` (1-based) for an industry."""
 	if rank <= 0:
 		return None
-	if year is None and month is None:
-		latest = _get_latest_period_for_industry(industry)
-		if latest:
-			year, month = str(latest["year"]), int(latest["month"])  # type: ignore[index]
-	entries = _get_scores_for_industry(industry)
-	entries = _filter_entries(entries, year=year, month=month)
-	if not entries:
-		return None
-	entries_sorted = sorted(entries, key=lambda r: int(r.get("ranking", 10**9)))
-	if rank > len(entries_sorted):
+	entries = _get_ranked_entries(_load_data(), industry, year=year, month=month)
+	if rank > len(entries):
 		return None
-	result = _transform_entry(entries_sorted[rank - 1])
-	result["industry"] = industry.upper()
-	return result
+	return entries[rank - 1]
 
 
 def search_companies(company: str, limit: int = 25, year: Optional[str] = None, month: Optional[int] = None) -> List[Dict[str, str]]:
@@ -253,36 +468,40 @@ def search_companies(company: str, limit: int = 25, year: Optional[str] = None,
 	Returns a list of { company, industry, ranking } items.
 	"""
 	company = company.strip().lower()
-	if not company:
+	if not company or _NAME_SEPARATOR in company:
 		return []
-	data = _load_data()
+	snap = _load_data()
+	haystack = snap.names_haystack
+	offsets = snap.name_offsets
 
 	# If no explicit period provided, restrict to the latest period per industry
-	latest_by_industry: Dict[str, Optional[Dict[str, object]]] = {}
-	if year is None and month is None:
-		for industry_key in (data.get("industries") or []):
-			latest_by_industry[industry_key] = _get_latest_period_for_industry(industry_key)
+	default_latest = year is None and month is None
+	year_str = str(year) if year is not None else None
 	results: List[Dict[str, str]] = []
-	for industry_key, entries in (data.get("scoresData", {}) or {}).items():
-		for entry in entries:
-			name = str(entry.get("company", ""))
-			# Determine effective year/month for this industry
-			_eff_year: Optional[str]
-			_eff_month: Optional[int]
-			if year is None and month is None:
-				latest = latest_by_industry.get(industry_key)
-				_eff_year = str(latest["year"]) if latest else None  # type: ignore[index]
-				_eff_month = int(latest["month"]) if latest else None  # type: ignore[index]
-			else:
-				_eff_year, _eff_month = year, month
-			if company in name.lower() and _matches_year_month(entry, year=_eff_year, month=_eff_month):
-				results.append({
-					"company": name,
-					"industry": industry_key,
-					"ranking": entry.get("ranking"),
-				})
-				if len(results) >= limit:
-					return results
+	# Let str.find scan the joined names in C; each hit maps back to its row by offset
+	pos = haystack.find(company)
+	while pos != -1:
+		i = bisect.bisect_right(offsets, pos) - 1
+		# Resume at the next name so a row matching several times is reported once
+		pos = haystack.find(company, offsets[i + 1]) if i + 1 < len(offsets) else -1
+		industry_key = snap.industries[i]
+		if default_latest:
+			latest = snap.latest_period_by_industry.get(industry_key)
+			if latest is not None and (snap.years[i], snap.months[i]) != latest:
+				continue
+		else:
+			if year_str is not None and snap.years[i] != year_str:
+				continue
+			if month is not None and snap.months[i] != month:
+				continue
+		entry = snap.rows[i]
+		results.append({
+			"company": str(entry.get("company", "")),
+			"industry": industry_key,
+			"ranking": entry.get("ranking"),
+		})
+		if len(results) >= limit:
+			break
 	return results
 
 
@@ -292,59 +511,36 @@ def get_industry_rankings(industry: str, limit: Optional[int] = None, offset: in
 	Entries are sorted by ascending ranking. If limit is provided, results are sliced
 	from offset to offset+limit.
 	"""
-	if year is None and month is None:
-		latest = _get_latest_period_for_industry(industry)
-		if latest:
-			year, month = str(latest["year"]), int(latest["month"])  # type: ignore[index]
-	entries = _get_scores_for_industry(industry)
-	entries = _filter_entries(entries, year=year, month=month)
-	if not entries:
-		return []
-	entries_sorted = sorted(entries, key=lambda r: int(r.get("ranking", 10**9)))
+	rows = _get_ranked_entries(_load_data(), industry, year=year, month=month)
 	if offset < 0:
 		offset = 0
 	if limit is None:
-		return [dict(_transform_entry(e), industry=industry.upper()) for e in entries_sorted[offset:]]
-	end = max(0, offset) + max(0, limit)
-	return [dict(_transform_entry(e), industry=industry.upper()) for e in entries_sorted[offset:end]]
+		return rows[offset:]
+	end = offset + max(0, limit)
+	return rows[offset:end]
 
 
-def get_top_companies(industry: str) -> List[Dict]:
+def get_top_companies(industry: str, snap: Optional[IndexSnapshot] = None) -> List[Dict]:
 	"""Return the `top_companies` list from the industry overview, if available."""
-	overview = get_industry_overview(industry)
+	overview = get_industry_overview(industry, snap=snap)
 	if not overview:
 		return []
 	return list(overview.get("top_companies", []) or [])
 
 
-def get_available_periods(industry: Optional[str] = None) -> List[Dict]:
-	"""Return unique available { year, month } combinations.
+def get_available_periods(industry: Optional[str] = None, snap: Optional[IndexSnapshot] = None) -> Tuple[Dict, ...]:
+	"""Return unique available { year, month } combinations, oldest first.
 
 	If `industry` is provided, the set is restricted to that industry's entries.
+	The result is precomputed per snapshot and shared, so callers must not mutate it.
 	"""
-	data = _load_data()
-	pairs = set()
+	return _list_periods(snap or _load_data(), industry=industry)
+
+
+def _list_periods(snap: IndexSnapshot, industry: Optional[str] = None) -> Tuple[Dict, ...]:
 	if industry:
-		entries = data.get("scoresData", {}).get(industry.upper(), []) or []
-		iter_entries = entries
-	else:
-		iter_entries = []
-		for _industry, entries in (data.get("scoresData", {}) or {}).items():
-			iter_entries.extend(entries)
-	for entry in iter_entries:
-		year_val = entry.get("year")
-		period_val = entry.get("month")
-		if year_val is None or period_val is None:
-			continue
-		try:
-			month_int = int(period_val)
-			year_str = str(year_val)
-		except (TypeError, ValueError):
-			continue
-		pairs.add((year_str, month_int))
-	# sort chronologically: year asc, month asc
-	sorted_pairs = sorted(list(pairs), key=lambda p: (int(p[0]) if str(p[0]).isdigit() else 0, int(p[1])))
-	return [{"year": y, "month": m} for (y, m) in sorted_pairs]
+		return snap.periods_by_industry.get(industry, ())
+	return snap.all_periods
 
 
 def _matches_year_month(entry: Dict, year: Optional[str], month: Optional[int]) -> bool:
@@ -368,47 +564,30 @@ def _filter_entries(entries: List[Dict], year: Optional[str], month: Optional[in
 	return [e for e in entries if _matches_year_month(e, year, month)]
 
 
-def _transform_entry(entry: Dict) -> Dict:
-	"""Transform a raw entry to API shape (already normalized)."""
-	# Entries are normalized on load; just return a shallow copy to avoid mutating callers
-	return dict(entry)
+def _build_discover_schema(snap: IndexSnapshot) -> Dict:
+	"""Build the discovery payload for a snapshot: industries, inferred schemas, and live examples.
 
-
-
-def get_discover_schema() -> Dict:
-	"""Return live discovery info: industries, inferred schemas, and live examples.
-
-	The payload is built from the current index data. A compact "schema" is
-	inferred from live example objects by inspecting their fields and mapping
-	Python types to human-friendly strings.
+	Called once from `_rebuild_indices`, so it reads the snapshot directly instead of
+	going through `_load_data()`.
 	"""
-	data = _load_data()
-	industries: List[str] = list(data.get("industries") or [])
+	industries: List[str] = list(snap.industry_names)
 
 	representative_industry: Optional[str] = industries[0] if industries else None
 
 	# Live examples
-	overview_example: Optional[Dict] = get_industry_overview(representative_industry) if representative_industry else None
-	company_ranking_example: Optional[Dict] = None
-	for industry_key, entries in (data.get("scoresData", {}) or {}).items():
-		if entries:
-			company_ranking_example = dict(_transform_entry(entries[0]), industry=industry_key)
-			break
-	periods_example: List[Dict] = get_available_periods()
+	overview_example: Optional[Dict] = snap.overview_by_name.get(representative_industry.upper()) if representative_industry else None
+	company_ranking_example: Optional[Dict] = snap.rows[0] if snap.rows else None
+	periods_example: Tuple[Dict, ...] = _list_periods(snap)
 
 	# Top companies example list
 	top_companies_list: List[Dict] = []
-	if representative_industry:
-		top_companies_list = get_top_companies(representative_industry)
-	if not top_companies_list and isinstance(overview_example, dict):
-		maybe = overview_example.get("top_companies")
-		if isinstance(maybe, list):
-			top_companies_list = list(maybe)
+	if isinstance(overview_example, dict):
+		top_companies_list = list(overview_example.get("top_companies", []) or [])
 
 	# Per-industry available periods
-	periods_by_industry: Dict[str, List[Dict]] = {}
+	periods_by_industry: Dict[str, Tuple[Dict, ...]] = {}
 	for ind in industries:
-		periods_by_industry[ind] = get_available_periods(industry=ind)
+		periods_by_industry[ind] = _list_periods(snap, industry=ind.upper())
 
 	return {
 		"industries": industries,
@@ -420,3 +599,13 @@ def get_discover_schema() -> Dict:
 			"periods_by_industry": periods_by_industry,
 		},
 	}
+
+
+def get_discover_schema(snap: Optional[IndexSnapshot] = None) -> Dict:
+	"""Return live discovery info: industries, inferred schemas, and live examples.
+
+	The payload is built from the current index data when the snapshot is loaded. A
+	compact "schema" is inferred from live example objects by inspecting their fields
+	and mapping Python types to human-friendly strings.
+	"""
+	return (snap or _load_data()).discover_schema
@@ -1,3 +1,5 @@
 bind = "0.0.0.0:8080"
 workers = 2
 
+# Workers keep the industries snapshot fresh in a background thread
+raw_env = ["BACKGROUND_REFRESH=1"]